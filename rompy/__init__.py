@@ -11,10 +11,20 @@ import warnings
 logger = logging.getLogger('rompy')
 
 import os
-import intake
 
 here = os.path.abspath(os.path.dirname(__file__))
-cat = intake.open_catalog(os.path.join(here, 'catalogs', 'master.yaml'))
+
+def __getattr__(name):
+    # Open the master catalog on first access to rompy.cat
+    if name == 'cat':
+        global cat
+        import intake
+        cat = intake.open_catalog(os.path.join(here, 'catalogs', 'master.yaml'))
+        return cat
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | {'cat'})
 
 from ._version import get_versions
 __version__ = get_versions()['version']
@@ -11,7 +11,6 @@ import cookiecutter.config as cc_config
 import cookiecutter.repository as cc_repository
 import cookiecutter.generate as cc_generate
 import os
-import glob
 import platform
 import logging
 import datetime
@@ -22,6 +21,10 @@ from types import SimpleNamespace
 
 logger = logging.getLogger('rompy.core')
 
+# Generation metadata that is fixed for the lifetime of the process
+_GENERATED_BY = os.environ.get('USER')
+_GENERATED_ON = platform.node()
+
 class BaseModel(SimpleNamespace):
 
     def __init__(self, run_id='run_0001', model=None, template=None, checkout=None, settings=None, output_dir=None):
@@ -48,7 +51,7 @@ class BaseModel(SimpleNamespace):
         )
 
         context_file = os.path.join(self._repo_dir, 'cookiecutter.json')
-        logger.debug('context_file is {}'.format(context_file))
+        logger.debug('context_file is %s', context_file)
 
         context = cc_generate.generate_context(
             context_file=context_file,
@@ -90,8 +93,8 @@ class BaseModel(SimpleNamespace):
 
         self.settings['run_id'] = self.run_id
         self.settings['_generated_at'] = str(datetime.datetime.utcnow())
-        self.settings['_generated_by'] = os.environ.get('USER')
-        self.settings['_generated_on'] = platform.node()
+        self.settings['_generated_by'] = _GENERATED_BY
+        self.settings['_generated_on'] = _GENERATED_ON
 
         # regenerate the context so that is is correctly templated
         context = cc_generate.generate_context(
@@ -118,22 +121,27 @@ class BaseModel(SimpleNamespace):
         if os.path.exists(zip_fn):
             os.remove(zip_fn)
 
+        # Collect the input files, skipping hidden entries
+        run_dirs = []
+        run_files = []
+        for root, dirs, files in os.walk(self.staging_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            run_dirs += [os.path.join(root, d) for d in dirs]
+            run_files += [os.path.join(root, f) for f in files if not f.startswith('.')]
+
         # Zip the input files
-        run_files=glob.glob(self.staging_dir + '/**/*', recursive=True)
         with zf.ZipFile(zip_fn, mode='w',compression=zf.ZIP_DEFLATED) as z:
-            for f in run_files:
+            for f in run_dirs + run_files:
                 z.write(f, f.replace(self.staging_dir,'')) #strip off the path prefix
         
         # Clean up run files leaving the settings.json
         for f in run_files:
             if not os.path.basename(f) == 'settings.json':
-                if os.path.isfile(f):
-                    os.remove(f)
+                os.remove(f)
                     
-        # Clean up any directories
-        for f in run_files:
-            if os.path.isdir(f):
-                os.rmdir(f)
+        # Clean up any directories, deepest first
+        for d in reversed(run_dirs):
+            os.rmdir(d)
 
         return zip_fn
 
@@ -143,11 +151,16 @@ class BaseGrid(SimpleNamespace):
 
     This is the base class for all Grid objects. The minimum representation of a grid are two NumPy array's representing the vertices or nodes of some structured or unstructured grid, its bounding box and a boundary polygon. No knowledge of the grid connectivity is expected.
 
+    The extents (``minx``, ``miny``, ``maxx``, ``maxy`` and so ``bbox()``) and the boundary polygon are cached
+    and are only recomputed when ``x`` or ``y`` is reassigned. Editing the arrays in place (e.g. ``grid.x[0, 0] = 0.0``)
+    does not invalidate them, so subclasses must always set ``x`` and ``y`` through the property setters.
+
     """
 
     def __init__(self):
         self.__x = None
         self.__y = None
+        self._cache = {}
 
     @property
     def x(self):
@@ -156,6 +169,7 @@ class BaseGrid(SimpleNamespace):
     @x.setter
     def x(self, x):
         self.__x = x
+        self._cache = {}
 
     @property
     def y(self):
@@ -164,22 +178,30 @@ class BaseGrid(SimpleNamespace):
     @y.setter
     def y(self, y):
         self.__y = y
+        self._cache = {}
+
+    def _extents(self):
+        """Grid extents (minx, miny, maxx, maxy), cached until x or y is reassigned"""
+        if 'extents' not in self._cache:
+            self._cache['extents'] = (np.nanmin(self.x), np.nanmin(self.y),
+                                      np.nanmax(self.x), np.nanmax(self.y))
+        return self._cache['extents']
 
     @property
     def minx(self):
-        return np.nanmin(self.x)
+        return self._extents()[0]
 
     @property
     def maxx(self):
-        return np.nanmax(self.x)
+        return self._extents()[2]
 
     @property
     def miny(self):
-        return np.nanmin(self.y)
+        return self._extents()[1]
 
     @property
     def maxy(self):
-        return np.nanmax(self.y)
+        return self._extents()[3]
 
     def bbox(self,buffer=0.0):
         """Returns a bounding box for the spatial grid
@@ -199,7 +221,7 @@ class BaseGrid(SimpleNamespace):
     def _get_boundary(self,tolerance=0.2):
         from shapely.geometry import MultiPoint
         
-        xys = list(zip(self.x.flatten(), self.y.flatten()))
+        xys = np.column_stack((self.x.ravel(), self.y.ravel()))
         polygon = MultiPoint(xys).convex_hull
         polygon = polygon.simplify(tolerance=tolerance)
 
@@ -218,8 +240,13 @@ class BaseGrid(SimpleNamespace):
         -------
         polygon : shapely.Polygon see https://shapely.readthedocs.io/en/stable/manual.html#Polygon
 
+        The polygon is cached per tolerance until x or y is reassigned.
+
         """
-        return self._get_boundary(tolerance=tolerance)
+        key = ('boundary', tolerance)
+        if key not in self._cache:
+            self._cache[key] = self._get_boundary(tolerance=tolerance)
+        return self._cache[key]
 
     def boundary_points(self,tolerance=0.2):
         """
@@ -234,16 +261,15 @@ class BaseGrid(SimpleNamespace):
 
         """
         polygon = self.boundary(tolerance=tolerance)
-        hull_x, hull_y = polygon.exterior.coords.xy
-        return hull_x, hull_y
+        hull = np.asarray(polygon.exterior.coords)
+        return hull[:, 0], hull[:, 1]
 
     def plot(self,fscale=10):
         import matplotlib.pyplot as plt
         import cartopy.crs as ccrs
         import cartopy.feature as cfeature
-        import cartopy.mpl.ticker as cticker
-        from shapely.geometry import MultiPoint
         from cartopy.mpl.gridliner import LONGITUDE_FORMATTER, LATITUDE_FORMATTER
+        from .plotting import _coastline
 
         # First set some plot parameters:
         bbox = self.bbox(buffer=0.1)
@@ -255,9 +281,7 @@ class BaseGrid(SimpleNamespace):
                 subplot_kw={'projection': ccrs.PlateCarree()})
         ax.set_extent(extents, crs=ccrs.PlateCarree())
 
-        coastline = cfeature.GSHHSFeature(scale='auto', edgecolor='black',
-                            facecolor=cfeature.COLORS['land'])
-        ax.add_feature(coastline, zorder=0)
+        ax.add_feature(_coastline(), zorder=0)
         ax.add_feature(cfeature.BORDERS, linewidth=2)
 
         gl = ax.gridlines(crs=ccrs.PlateCarree(), draw_labels=True,
@@ -268,7 +292,7 @@ class BaseGrid(SimpleNamespace):
 
         # Plot the model domain
         bx, by = self.boundary_points()
-        poly = plt.Polygon(list(zip(bx, by)),facecolor='r',alpha=0.05)
+        poly = plt.Polygon(np.column_stack((bx, by)),facecolor='r',alpha=0.05)
         ax.add_patch(poly)
         ax.plot(bx,by,lw=2,color='k')
         return fig, ax
\ No newline at end of file
@@ -9,6 +9,9 @@
 def sort_filter(ds,coords):
     for c in coords:
         if c in ds:
+            # sortby reindexes every variable, so skip axes already in order
+            if c in ds.indexes and ds.indexes[c].is_monotonic_increasing:
+                continue
             ds = ds.sortby(c)
     return ds
 
@@ -21,10 +24,26 @@ def crop_filter(ds,data_slice):
     if data_slice is not None:
         this_crop = {k:data_slice[k] for k in data_slice.keys() if k in ds.dims.keys()}
         ds = ds.sel(this_crop)
-        for k in data_slice.keys():
-            if (k not in ds.dims.keys()) and (k in ds.coords.keys()):
-                ds=ds.where(ds[k]>float(data_slice[k][0]),drop=True)
-                ds=ds.where(ds[k]<float(data_slice[k][1]),drop=True)
+        bounds = [k for k in data_slice.keys() if (k not in ds.dims.keys()) and (k in ds.coords.keys())]
+        if bounds:
+            import numpy as np
+            # Trim each bound in turn on the coordinates alone, keeping any row or
+            # column with a point inside it, then mask the data once on that box
+            keep = {}
+            for k in bounds:
+                for op, lim in ((np.greater, data_slice[k][0]), (np.less, data_slice[k][1])):
+                    c = ds[k].isel({d:keep[d] for d in ds[k].dims if d in keep})
+                    cond = op(c.values, float(lim))
+                    for ax, dim in enumerate(c.dims):
+                        others = tuple(i for i in range(cond.ndim) if i != ax)
+                        idx = keep.get(dim, np.arange(ds.sizes[dim]))
+                        keep[dim] = idx[np.any(cond, axis=others)]
+            ds = ds.isel(keep)
+            mask = None
+            for k in bounds:
+                inside = (ds[k]>float(data_slice[k][0])) & (ds[k]<float(data_slice[k][1]))
+                mask = inside if mask is None else mask & inside
+            ds = ds.where(mask)
     return ds
 
 def timenorm_filter(ds,interval={'interval':'hour'},reftime=None):
@@ -44,19 +63,21 @@ def rename_filter(ds,varmap):
     ds = ds.rename(varmap)
     return ds
 
+# Registry of named filters
+_FILTER_FNS = {'sort': sort_filter,
+               'subset': subset_filter,
+               'crop': crop_filter,
+               'timenorm': timenorm_filter,
+               'rename': rename_filter}
+
 def get_filter_fns():
-    return {'sort': sort_filter,
-            'subset': subset_filter,
-            'crop': crop_filter,
-            'timenorm': timenorm_filter,
-            'rename': rename_filter}
+    return dict(_FILTER_FNS)
 
 def _open_preprocess(url,chunks,filters,xarray_kwargs):
     import xarray as xr
     ds = xr.open_dataset(url,chunks=chunks,**xarray_kwargs)
-    filter_fns = get_filter_fns()
     for fn, params in filters.items():
         if isinstance(fn,str):
-            fn = filter_fns[fn]
+            fn = _FILTER_FNS[fn]
         ds = fn(ds,params)
     return ds
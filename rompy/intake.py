@@ -119,9 +119,9 @@ class NetCDFFCStackSource(DataSourceMixin):
         self._original_urlpath = urlpath
 
         if self.deterministic_pattern:
-            logger.info(f'Scanning urlpath={urlpath}\n fn_fmt={self.fn_fmt}')
+            logger.info('Scanning urlpath=%s\n fn_fmt=%s', urlpath, self.fn_fmt)
             self._urlpath = walk_server(urlpath, self.fn_fmt, self.fmt_fields, self.url_replace)
-            logger.info(f'Found {len(self.urlpath)}')
+            logger.info('Found %d', len(self.urlpath))
         else:
             self._urlpath = urlpath
 
@@ -151,10 +151,12 @@ class NetCDFFCStackSource(DataSourceMixin):
                 futures = [__open_preprocess(url,self.chunks,self.ds_filters,self.xarray_kwargs) for url in self.urlpath]
                 dsets = compute(*futures,traverse=False)
                 if len(dsets[0].lead) == 1: # Assumes this indicates that each timestep of forecase is separate file
-                    inits = [to_datetime(ds.init.values[0]) for ds in dsets]
+                    # Group the datasets by init time
+                    by_init = {}
+                    for ds in dsets:
+                        by_init.setdefault(to_datetime(ds.init.values[0]), []).append(ds)
                     dsets_concat = []
-                    for i in set(inits):
-                        subset = [ds for ds in dsets if ds.init.values[0] == i]
+                    for i, subset in by_init.items():
                         ds_concat = xr.concat(subset,
                                               dim='lead',
                                               coords=['time'],
@@ -6,21 +6,33 @@
 # The full license is in the LICENSE file, distributed with this software.
 #-----------------------------------------------------------------------------
 
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _coastline(scale='auto'):
+    """Shared GSHHS coastline feature, built once and reused across plots"""
+    import cartopy.feature as cfeature
+    return cfeature.GSHHSFeature(scale=scale, edgecolor='black',
+                                 facecolor=cfeature.COLORS['land'])
+
 def scatter(ds,color,minLon=None,minLat=None,maxLon=None,maxLat=None,fscale=10):
+    import numpy as np
     import matplotlib.pyplot as plt
     from mpl_toolkits.axes_grid1.inset_locator import inset_axes
     from datetime import datetime
     import cartopy.crs as ccrs
     import cartopy.feature as cfeature
-    import cartopy.mpl.ticker as cticker
-    from shapely.geometry import MultiPoint
     from cartopy.mpl.gridliner import LONGITUDE_FORMATTER, LATITUDE_FORMATTER
 
     # First set some plot parameters:
-    if not minLon: minLon = ds.LONGITUDE.min().values.item()
-    if not minLat: minLat = ds.LATITUDE.min().values.item()
-    if not maxLon: maxLon = ds.LONGITUDE.max().values.item()
-    if not maxLat: maxLat = ds.LATITUDE.max().values.item()
+    if not (minLon and maxLon):
+        lon = ds.LONGITUDE.values
+        if not minLon: minLon = np.nanmin(lon).item()
+        if not maxLon: maxLon = np.nanmax(lon).item()
+    if not (minLat and maxLat):
+        lat = ds.LATITUDE.values
+        if not minLat: minLat = np.nanmin(lat).item()
+        if not maxLat: maxLat = np.nanmax(lat).item()
     extents = [minLon, maxLon, minLat, maxLat]
 
     # create figure and plot/map
@@ -28,9 +40,7 @@ def scatter(ds,color,minLon=None,minLat=None,maxLon=None,maxLat=None,fscale=10):
             subplot_kw={'projection': ccrs.PlateCarree()})
     ax.set_extent(extents, crs=ccrs.PlateCarree())
 
-    coastline = cfeature.GSHHSFeature(scale='auto', edgecolor='black',
-                        facecolor=cfeature.COLORS['land'])
-    ax.add_feature(coastline, zorder=0)
+    ax.add_feature(_coastline(), zorder=0)
     ax.add_feature(cfeature.BORDERS, linewidth=2)
 
     gl = ax.gridlines(crs=ccrs.PlateCarree(), draw_labels=True,
@@ -40,9 +50,10 @@ def scatter(ds,color,minLon=None,minLat=None,maxLon=None,maxLat=None,fscale=10):
     gl.yformatter = LATITUDE_FORMATTER
     
     if 'PARTITION' in ds:
-        sc=ax.scatter([ds.sel(PARTITION=part).LONGITUDE for part in ds.PARTITION],
-                        [ds.sel(PARTITION=part).LATITUDE for part in ds.PARTITION],
-                        c=[ds.sel(PARTITION=part)[color] for part in ds.PARTITION])
+        parts = [ds.sel(PARTITION=part) for part in ds.PARTITION]
+        sc=ax.scatter([p.LONGITUDE for p in parts],
+                        [p.LATITUDE for p in parts],
+                        c=[p[color] for p in parts])
     else:
         sc=ax.scatter(ds.LONGITUDE,ds.LATITUDE,c=ds[color])        
     
@@ -248,19 +248,23 @@ class SwanGrid(BaseGrid):
 
         #Work out the closest spectral points
         def _nearestPointOnLine(p1, p2, p3):
-            # calculate the distance of p3 from the line between p1 and p2 and return 
-            # the closest point on the line
+            # calculate the distance of each point in the (N, 2) array p3 from the
+            # line between p1 and p2 and return the closest points on the line
 
-            from math import sqrt, fabs
             a = p2[1] - p1[1]
             b = -1. * (p2[0] - p1[0])
             c = p2[0] * p1[1] - p2[1] * p1[0]
+            norm = a ** 2 + b ** 2
+            x3 = p3[:, 0]
+            y3 = p3[:, 1]
 
-            dist = fabs(a * p3[0] + b * p3[1] + c) / sqrt(a ** 2 + b ** 2)
-            x = (b * (b * p3[0] - a * p3[1]) - a * c) / (a ** 2 + b ** 2)
-            y = (a * (-b * p3[0] + a * p3[1]) - b * c) / (a ** 2 + b ** 2)
+            # A zero-length segment gives NaN distances, which never match
+            with np.errstate(divide='ignore', invalid='ignore'):
+                dist = np.abs(a * x3 + b * y3 + c) / np.sqrt(norm)
+                x = (b * (b * x3 - a * y3) - a * c) / norm
+                y = (a * (-b * x3 + a * y3) - b * c) / norm
 
-            return dist, x, y
+            return dist, np.column_stack((x, y))
 
         bx, by = self.boundary_points()
         pol = np.stack([bx,by])
@@ -270,45 +274,51 @@ class SwanGrid(BaseGrid):
         ds_spec.lat.load()
         ds_spec['lon_original']=ds_spec['lon']
         ds_spec['lat_original']=ds_spec['lat']
-        p3s = list(zip(ds_spec.lon.values,ds_spec.lat.values))
+        p3s = np.column_stack((ds_spec.lon.values,ds_spec.lat.values))
 
         if plot:
             fig,ax = self.plot()
             ax.scatter(ds_spec.lon,ds_spec.lat)
 
-        specPoints = []
+        specInds = []
         specPointCoords = []
         for i in range(pol.shape[1]-1):
             p1 = pol[:,i]
             p2 = pol[:,i+1]
             line = np.stack((p1, p2))
-            output = np.array(list(map(lambda xi: _nearestPointOnLine(p1, p2, xi), p3s)))
-            dists = output[:, 0]
-            segmentPoints = output[:, 1:]
+            dists, segmentPoints = _nearestPointOnLine(p1, p2, p3s)
             inds = np.where((dists < dist_thres))[0]
             
             # Loop through the points projected onto the line
-            for ind in inds:
-                specPoint=ds_spec.isel(site=ind)
-
-                segLon = segmentPoints[ind, 0]
-                segLat = segmentPoints[ind, 1]
-                
-                if plot:
-                    ax.plot([segLon, specPoint.lon],[segLat, specPoint.lat],color='r',lw=2)
-                    ax.scatter(specPoint.lon,specPoint.lat,marker='o',color='b')
+            if plot:
+                for ind in inds:
+                    segLon = segmentPoints[ind, 0]
+                    segLat = segmentPoints[ind, 1]
+                    ax.plot([segLon, p3s[ind, 0]],[segLat, p3s[ind, 1]],color='r',lw=2)
+                    ax.scatter(p3s[ind, 0],p3s[ind, 1],marker='o',color='b')
                     ax.scatter(segLon,segLat,marker='x',color='g')
+
+            specInds.extend(inds)
+            specPointCoords.extend(segmentPoints[inds])
                 
-                specPoint['lon'] = segLon
-                specPoint['lat'] = segLat
-                specPoints.append(specPoint)
-                
-            logger.debug(f"Segment {i} - Indices {inds}")
+            logger.debug("Segment %d - Indices %s", i, inds)
 
         if plot: 
             fig.show()
 
-        ds_boundary = xr.concat(specPoints,dim='site')
+        if not specInds:
+            raise ValueError(f'No spectra found within {dist_thres} of the grid boundary')
+
+        # Select the boundary spectra and move them onto the boundary
+        specPointCoords = np.array(specPointCoords)
+        ds_boundary = ds_spec.isel(site=np.array(specInds))
+        # Stack of boundary sites: site leads and site-less variables are repeated per site
+        for v in list(ds_boundary.data_vars):
+            if 'site' not in ds_boundary[v].dims:
+                ds_boundary[v] = ds_boundary[v].expand_dims(site=ds_boundary.sizes['site'])
+        ds_boundary = ds_boundary.transpose('site', ...)
+        ds_boundary['lon'] = ('site', specPointCoords[:, 0])
+        ds_boundary['lat'] = ('site', specPointCoords[:, 1])
         return ds_boundary
 
 
@@ -334,13 +344,15 @@ class Swan_accessor(object):
         if grid is None:
             # If no grid passed in assume it is a REG grid
             if len(ds[x].shape) == 1:
+                xv = ds[x].values
+                yv = ds[y].values
                 grid = SwanGrid(gridtype="REG",
-                                x0=float(ds[x].min()),
-                                y0=float(ds[y].min()),
-                                dx=float(np.diff(ds[x]).mean()),
-                                dy=float(np.diff(ds[y]).mean()),
-                                nx=len(ds[x]),
-                                ny=len(ds[y]),
+                                x0=float(np.nanmin(xv)),
+                                y0=float(np.nanmin(yv)),
+                                dx=float(np.diff(xv).mean()),
+                                dy=float(np.diff(yv).mean()),
+                                nx=len(xv),
+                                ny=len(yv),
                                 rot=0
                 )
             else:
@@ -351,12 +363,13 @@ class Swan_accessor(object):
         # ds = ds.transpose((time,) + ds[x].dims)
         dt = np.diff(ds.time.values).mean()/pd.to_timedelta(1,'H')
 
+        time_strs = ds['time'].dt.strftime('%Y%m%d.%H%M%S').values
+
         inptimes = []
         with open(output_file, 'wt') as f:
             # iterate through time
-            for ti, windtime in enumerate(ds.time.values):
+            for ti, time_str in enumerate(time_strs):
 
-                time_str = pd.to_datetime(windtime).strftime("%Y%m%d.%H%M%S")
                 logger.debug(time_str)
 
                 # write SWAN time header to file:
@@ -400,14 +413,14 @@ class Swan_accessor(object):
         '''
         from shapely.ops import substring
 
-        bound_string = "BOUNDSPEC SEGM XY "
+        bound_parts = ["BOUNDSPEC SEGM XY "]
         point_string = "&\n {xp:0.8f} {yp:0.8f} "
         file_string = "&\n {len:0.8f} '{fname}' 1 "
 
         for xp, yp in boundary.exterior.coords:
-            bound_string += point_string.format(xp=xp,yp=yp)
+            bound_parts.append(point_string.format(xp=xp,yp=yp))
 
-        bound_string += "&\n VAR FILE "
+        bound_parts.append("&\n VAR FILE ")
 
         n_pts = int((boundary.length)/interval)
         splits = np.linspace(0,1.,n_pts)
@@ -417,22 +430,24 @@ class Swan_accessor(object):
             segment=substring(boundary.exterior, splits[i], splits[i+1],normalized=True)
             xp = segment.coords[1][0]
             yp = segment.coords[1][1]
-            logger.debug(f'Extracting point: {xp},{yp}')
+            logger.debug('Extracting point: %s,%s', xp, yp)
             ds_point = self._obj.sel(indexers={x_var:xp,y_var:yp},method='nearest',tolerance=interval)
             if len(ds_point.time)==len(self._obj.time):
-                if not np.any(np.isnan(ds_point[hs_var])):
+                hs = ds_point[hs_var].values
+                if not np.any(np.isnan(hs)):
+                    per = ds_point[per_var].values
+                    dirn = ds_point[dir_var].values
+                    times = ds_point['time'].dt.strftime('%Y%m%d.%H%M%S').values
+                    lf = '{tt} {hs:0.2f} {per:0.2f} {dirn:0.1f} {spr:0.2f}\n'
+                    rows = [lf.format(tt=times[t],
+                                      hs=float(hs[t]),
+                                      per=float(per[t]),
+                                      dirn=float(dirn[t]),
+                                      spr=dir_spread) for t in range(len(times))]
                     with open(f'{dest_path}/{j}.TPAR', 'wt') as f:
-                        f.write('TPAR\n')
-                        for t in range(len(ds_point.time)):
-                            ds_row=ds_point.isel(time=t)
-                            lf = '{tt} {hs:0.2f} {per:0.2f} {dirn:0.1f} {spr:0.2f}\n'
-                            f.write(lf.format(tt=str(ds_row['time'].dt.strftime('%Y%m%d.%H%M%S').values),
-                                            hs=float(ds_row[hs_var]),
-                                            per=float(ds_row[per_var]),
-                                            dirn=float(ds_row[dir_var]),
-                                            spr=dir_spread))
-                    bound_string += file_string.format(len=splits[i+1]*boundary.length,
-                                                       fname=f'{j}.TPAR')
+                        f.write('TPAR\n' + ''.join(rows))
+                    bound_parts.append(file_string.format(len=splits[i+1]*boundary.length,
+                                                          fname=f'{j}.TPAR'))
                     j+=1
 
-        return bound_string
+        return ''.join(bound_parts)
@@ -0,0 +1,20 @@
+import os
+import zipfile
+
+
+def test_zip_nested_staging_dir(tmp_path):
+    from rompy.core import BaseModel
+
+    # Skip the cookiecutter set up in __init__, zip only needs the staging dir
+    model = BaseModel.__new__(BaseModel)
+    model.staging_dir = str(tmp_path)
+    os.makedirs(tmp_path / 'a' / 'b')
+    (tmp_path / 'a' / 'b' / 'f.txt').write_text('data')
+    (tmp_path / 'INPUT').write_text('input')
+    (tmp_path / 'settings.json').write_text('{}')
+
+    zip_fn = model.zip()
+
+    with zipfile.ZipFile(zip_fn) as z:
+        assert sorted(z.namelist()) == ['INPUT', 'a/', 'a/b/', 'a/b/f.txt', 'settings.json']
+    assert sorted(os.listdir(tmp_path)) == ['settings.json', 'simulation.zip']
@@ -0,0 +1,30 @@
+import numpy as np
+import xarray as xr
+
+
+def _rotated_grid(ny=40, nx=50, angle=30.):
+    j, i = np.meshgrid(np.arange(ny), np.arange(nx), indexing='ij')
+    a = np.deg2rad(angle)
+    lon = 110 + 0.1*(i*np.cos(a) - j*np.sin(a))
+    lat = -30 + 0.1*(i*np.sin(a) + j*np.cos(a))
+    rng = np.random.default_rng(0)
+    return xr.Dataset({'hs':(('time','y','x'),rng.random((2,ny,nx)))},
+                      coords={'lon':(('y','x'),lon),'lat':(('y','x'),lat),'time':[0,1]})
+
+
+def _sequential_crop(ds, data_slice):
+    for k in data_slice.keys():
+        ds = ds.where(ds[k]>float(data_slice[k][0]),drop=True)
+        ds = ds.where(ds[k]<float(data_slice[k][1]),drop=True)
+    return ds
+
+
+def test_crop_filter_rotated_grid():
+    from rompy.filters import crop_filter
+
+    ds = _rotated_grid()
+    data_slice = {'lon':[111,112.5],'lat':[-29.5,-27.5]}
+    cropped = crop_filter(ds, data_slice)
+
+    assert dict(cropped.sizes) == {'time':2,'y':22,'x':38}
+    assert cropped.identical(_sequential_crop(ds, data_slice))
@@ -0,0 +1,51 @@
+import warnings
+
+import numpy as np
+import xarray as xr
+
+
+def _grid():
+    from rompy.swan import SwanGrid
+    # Regular grid spanning 115.0-116.1E, 33.0-31.9S
+    return SwanGrid(gridtype='REG', x0=115., y0=-33., rot=0., dx=0.1, dy=0.1, nx=11, ny=11)
+
+
+def _spectra():
+    # Sites just outside the bottom, right and left edges, one inside and one far away
+    lon = [115.5, 115.5, 116.13, 114.0, 115.02]
+    lat = [-33.02, -32.5, -32.5, -32.5, -32.0]
+    return xr.Dataset({'efth':(('time','site','freq'), np.arange(2*5*3.).reshape(2,5,3)),
+                       'freqw':(('freq',), np.arange(3.)),
+                       'lon':(('site',), lon),
+                       'lat':(('site',), lat)},
+                      coords={'time':[0,1],'freq':[.1,.2,.3]})
+
+
+def _check_boundary(ds, ds_boundary):
+    assert ds_boundary['efth'].dims == ('site','time','freq')
+    assert ds_boundary['freqw'].dims == ('site','freq')
+    # Matched sites in boundary order: left, right then bottom edge
+    np.testing.assert_array_equal(ds_boundary['efth'].values, ds['efth'].values[:, [4, 2, 0]].transpose(1, 0, 2))
+    np.testing.assert_allclose(ds_boundary['lon_original'].values, [115.02, 116.13, 115.5])
+    np.testing.assert_allclose(ds_boundary['lat_original'].values, [-32.0, -32.5, -33.02])
+    np.testing.assert_allclose(ds_boundary['lon'].values, [115.0, 116.1, 115.5])
+    np.testing.assert_allclose(ds_boundary['lat'].values, [-32.0, -32.5, -33.0])
+
+
+def test_nearby_spectra():
+    ds = _spectra()
+    _check_boundary(ds, _grid().nearby_spectra(ds, plot=False))
+
+
+def test_nearby_spectra_zero_length_segment():
+    from shapely.geometry import Polygon
+
+    # Boundary with a repeated first vertex, i.e. one zero-length segment
+    grid = _grid()
+    grid._get_boundary = lambda tolerance=0.2: Polygon([(115.,-33.),(115.,-33.),(115.,-31.9),(116.1,-31.9),(116.1,-33.)])
+
+    ds = _spectra()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        ds_boundary = grid.nearby_spectra(ds, plot=False)
+    _check_boundary(ds, ds_boundary)
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+T0 = np.datetime64('2021-02-10T00:00')
+
+
+def _model():
+    # Model times deliberately out of order: 2h, 0h, 1h
+    times = T0 + np.array([120, 0, 60], dtype='timedelta64[m]')
+    it, ilat, ilon = np.meshgrid(np.arange(3), np.arange(2), np.arange(3), indexing='ij')
+    return xr.Dataset({'hs':(('time','latitude','longitude'),(100*it + 10*ilat + ilon).astype(float))},
+                      coords={'time':times,'latitude':[0.,1.],'longitude':[0.,1.,2.]})
+
+
+def _measurement(minutes, lats, lons):
+    return pd.DataFrame({'TIME':T0 + np.array(minutes, dtype='timedelta64[m]'),
+                         'LATITUDE':lats,
+                         'LONGITUDE':lons,
+                         'HS':np.arange(len(minutes), dtype=float)})
+
+
+def test_find_matchup_data_threshold_is_strict():
+    from rompy.utils import find_matchup_data
+
+    # 29 min matches the 0h output only; 30 min is exactly time_thresh from 0h and 1h
+    meas = _measurement([29, 30], [1., 0.], [2., 0.])
+    out = find_matchup_data(meas, _model(), {'HS':'hs'})
+
+    assert out.sizes['observation'] == 1
+    assert out['meas_hs'].values.tolist() == [0.]
+    assert out['model_time'].values.tolist() == [T0]
+    assert out['model_hs'].values.tolist() == [112.]
+
+
+def test_find_matchup_data_unsorted_model_times():
+    from rompy.utils import find_matchup_data
+
+    meas = _measurement([60, 0], [0., 1.], [1., 0.])
+    out = find_matchup_data(meas, _model(), {'HS':'hs'}, time_thresh=90)
+
+    # Matches for each measurement follow the model's own time order
+    assert out['meas_hs'].values.tolist() == [0., 0., 0., 1., 1.]
+    assert out['model_hs'].values.tolist() == [1., 101., 201., 110., 210.]
+
+
+def test_find_matchup_data_no_matches():
+    from rompy.utils import find_matchup_data
+
+    meas = _measurement([600, -600], [0., 1.], [0., 2.])
+    out = find_matchup_data(meas, _model(), {'HS':'hs'})
+
+    assert out.sizes['observation'] == 0
+    assert 'model_hs' in out and 'meas_hs' in out
@@ -10,7 +10,6 @@ import numpy as np
 import xarray as xr
 import logging
 import pandas as pd
-from scipy.spatial import KDTree
 
 logger = logging.getLogger("rompy.util")
 
@@ -28,17 +27,18 @@ def walk_server(urlpath, fn_fmt, fmt_fields, url_replace):
         import dask.config as dc
 
         # Targetted scans of the file system based on date range
-        test_urls = set([urlpath.format(**pv) for pv in dict_product(fmt_fields)])
-        test_fns = set([fn_fmt.format(**pv) for pv in dict_product(fmt_fields)])
+        fields = list(dict_product(fmt_fields))
+        test_urls = set([urlpath.format(**pv) for pv in fields])
+        test_fns = set([fn_fmt.format(**pv) for pv in fields])
 
-        logger.debug(f'Test URLS : {test_urls}')
+        logger.debug('Test URLS : %s', test_urls)
 
         @delayed
         def check_url(test_url,test_fns):
             from fsspec import filesystem
             from fsspec.utils import get_protocol
             fs = filesystem(get_protocol(test_url))
-            logger.debug(f'testing {test_url}')
+            logger.debug('testing %s', test_url)
             urls = []
             if fs.exists(test_url):
                 for url, _ , links in fs.walk(test_url):
@@ -51,7 +51,7 @@ def walk_server(urlpath, fn_fmt, fmt_fields, url_replace):
         # valid_urls = [check_url(test_url,test_fns) for test_url in test_urls]
         valid_urls = sorted(reduce(iconcat,valid_urls,[]))
 
-        logger.debug(f'valid_urls : {valid_urls}')
+        logger.debug('valid_urls : %s', valid_urls)
 
         for f,r in url_replace.items():
             valid_urls = [u.replace(f,r) for u in valid_urls]
@@ -85,6 +85,7 @@ def find_matchup_data(measurement,model,var_map,time_thresh=None,KDtree_kwargs={
     ds: xarray.dataset
         Xarray dataset containing measurements and nearest model outputs
     """
+    from scipy.spatial import cKDTree
     
     ### Remove case-sensitivity from measurement dataframe/ds by making everything lowercase, try to make the lat/lon/time calls a little more robust
     if type(measurement) == xr.Dataset:
@@ -123,8 +124,8 @@ def find_matchup_data(measurement,model,var_map,time_thresh=None,KDtree_kwargs={
     else:
         raise ValueError('Model dataset has an unsupported grid type')
 
-    tree=KDTree(list(zip(mesh_lat.ravel(),mesh_lon.ravel())),**KDtree_kwargs)
-    dist,grid_idx_r=tree.query(list(zip(measurement['latitude'],measurement['longitude'])))
+    tree=cKDTree(np.column_stack((mesh_lat.ravel(),mesh_lon.ravel())),**KDtree_kwargs)
+    dist,grid_idx_r=tree.query(np.column_stack((np.asarray(measurement['latitude']),np.asarray(measurement['longitude']))))
 
     if grid in ['regular','curvilinear']:
         grid_idx_lat,grid_idx_lon=np.unravel_index(grid_idx_r,mesh_lon.shape)
@@ -134,16 +135,22 @@ def find_matchup_data(measurement,model,var_map,time_thresh=None,KDtree_kwargs={
     meas_times = measurement.time.values
     model_times = model.time.values
     
-    ## Initialise a dict that we can append to 
-    measurement_idx = []
-    model_time_idx = []
-            
-    for i,time in enumerate(meas_times):
-        inds =  np.argwhere(np.abs(model_times - time) < time_thresh) ## within time_thresh
-        if inds.size > 0:
-            for time_idx in inds:
-                measurement_idx.append(i)
-                model_time_idx.append(int(time_idx))
+    ## Find the model times strictly within time_thresh of each measurement
+    order = np.argsort(model_times, kind='stable')
+    sorted_times = model_times[order]
+    lo = np.searchsorted(sorted_times, meas_times - time_thresh, side='right')
+    hi = np.searchsorted(sorted_times, meas_times + time_thresh, side='left')
+    counts = np.maximum(hi - lo, 0)
+
+    ## Expand the windows into (measurement, model time) index pairs
+    measurement_idx = np.repeat(np.arange(len(meas_times)), counts)
+    offsets = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+    model_time_idx = order[np.arange(counts.sum()) + offsets]
+    if not np.all(order[:-1] < order[1:]):
+        ## Keep model times in their original order for each measurement
+        pairs = np.lexsort((model_time_idx, measurement_idx))
+        measurement_idx = measurement_idx[pairs]
+        model_time_idx = model_time_idx[pairs]
                 
     ######## Now retrieve data from model and measurements for indices
     model_time_idx =  xr.DataArray(model_time_idx,dims='observation')